@@ -168,7 +168,7 @@ def doit(prefix, search_path, files, cpp, debug=False):
         # find the file in the first part of the search path it exists
         if len(search_path) > 0:
             for p in search_path:
-                full_file = "{}/{}".format(p, cf)
+                full_file = os.path.join(p, cf)
                 if os.path.isfile(full_file):
                     break
         else:
@@ -30,7 +30,7 @@ def find_files(vpath, files_in):
         found = False
 
         for d in vpath:
-            if os.path.isfile("{}/{}".format(d, f)):
+            if os.path.isfile(os.path.join(d, f)):
                 found = True
                 files.append((f, d))
                 break